@@ -12,13 +12,112 @@ Let's use 71 (gift as noun) + 115 (gifts as verb of giving) = 186?
 Let me be more intentional: "gifts" = 7+9+6+20+19 = 61
 """
 
+import PIL
 from PIL import Image, ImageDraw
-import random
-import math
+from functools import lru_cache
+import numpy as np
 
 # Seed from "gifts" letter values
 SEED = 61  # g(7) + i(9) + f(6) + t(20) + s(19)
-random.seed(SEED)
+rng = np.random.default_rng(SEED)
+
+BACKGROUND_PROFILE = (0x0a, 0x0a, 0x12)
+BACKGROUND_BANNER = (0x0f, 0x0f, 0x1a)
+
+
+def hex_to_rgb(color):
+    """Parse '#rrggbb' into an (r, g, b) uint8 triple (parsed once per gift)"""
+    return np.array(
+        [int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)],
+        dtype=np.uint8
+    )
+
+
+@lru_cache(maxsize=None)
+def make_gift_stamp(size, color, ribbon_width, overhang, bow_size):
+    """Draw box + crossing ribbons + bow once into a reusable RGBA tile.
+
+    Cached per (size, color, ...) so each gift placement becomes a single
+    paste instead of four draw calls.
+    """
+    # +1 because PIL box coordinates are inclusive (as in make_stone_stamp)
+    side = size + 2 * overhang + 1
+    stamp = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+    d = ImageDraw.Draw(stamp)
+    c = side // 2
+
+    # Gift box
+    d.rectangle(
+        [c - size // 2, c - size // 2, c + size // 2, c + size // 2],
+        fill=color
+    )
+    # Horizontal ribbon
+    d.rectangle(
+        [c - size // 2 - overhang, c - ribbon_width // 2,
+         c + size // 2 + overhang, c + ribbon_width // 2],
+        fill='#ffffff'
+    )
+    # Vertical ribbon
+    d.rectangle(
+        [c - ribbon_width // 2, c - size // 2 - overhang,
+         c + ribbon_width // 2, c + size // 2 + overhang],
+        fill='#ffffff'
+    )
+    # Bow
+    d.ellipse(
+        [c - bow_size, c - bow_size, c + bow_size, c + bow_size],
+        fill='#ffffff'
+    )
+    return stamp
+
+
+@lru_cache(maxsize=None)
+def make_stone_stamp(stone_width, stone_height):
+    """One cairn stone as a cached RGBA tile, keyed by its dimensions"""
+    stamp = Image.new('RGBA', (stone_width + 1, stone_height + 1), (0, 0, 0, 0))
+    d = ImageDraw.Draw(stamp)
+    d.ellipse([0, 0, stone_width, stone_height], fill='#6b705c', outline='#4a4e45')
+    return stamp
+
+
+def paste_stamp(img, stamp, x, y):
+    """Paste a cached stamp centered on (x, y), using its own alpha as mask"""
+    img.paste(stamp, (x - stamp.width // 2, y - stamp.height // 2), stamp)
+
+
+_DISK_MASKS = {}
+
+
+def disk_mask(r):
+    """Boolean disk of radius r (cached; only a few distinct radii occur)"""
+    if r not in _DISK_MASKS:
+        yy, xx = np.mgrid[-r:r + 1, -r:r + 1]
+        _DISK_MASKS[r] = xx * xx + yy * yy <= r * r
+    return _DISK_MASKS[r]
+
+
+def stamp_sparkles(canvas, rng, count, x_hi, y_hi, r_lo, r_hi, b_lo, b_hi):
+    """Stamp `count` grayscale dots onto the canvas in one batch.
+
+    Draws all coordinates, radii and brightnesses from the generator in four
+    vectorized calls, then blits each dot through a small cached disk mask —
+    no per-sparkle randint/ellipse round-trips.
+    """
+    xs = rng.integers(0, x_hi + 1, count)
+    ys = rng.integers(0, y_hi + 1, count)
+    rs = rng.integers(r_lo, r_hi + 1, count)
+    brs = rng.integers(b_lo, b_hi + 1, count, dtype=np.uint8)
+    h, w = canvas.shape[:2]
+
+    for x, y, r, b in zip(xs, ys, rs, brs):
+        x0, y0 = x - r, y - r
+        tx0, ty0 = max(x0, 0), max(y0, 0)
+        tx1, ty1 = min(x + r + 1, w), min(y + r + 1, h)
+        if tx0 >= tx1 or ty0 >= ty1:
+            continue
+        mask = disk_mask(r)[ty0 - y0:ty1 - y0, tx0 - x0:tx1 - x0]
+        canvas[ty0:ty1, tx0:tx1][mask] = b
+
 
 def create_profile_image():
     """
@@ -29,8 +128,11 @@ def create_profile_image():
     - Background: deep space, gifts floating
     """
     size = 800
-    img = Image.new('RGB', (size, size), '#0a0a12')
-    draw = ImageDraw.Draw(img)
+    canvas = np.full((size, size, 3), BACKGROUND_PROFILE, dtype=np.uint8)
+
+    # All glows accumulate on one RGBA overlay, composited in a single pass
+    glow = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    glow_rect = ImageDraw.Draw(glow).rectangle  # bound once, called in a loop
 
     # Gift positions (scattered but balanced)
     gifts = [
@@ -41,89 +143,51 @@ def create_profile_image():
         {'x': 620, 'y': 600, 'size': 75, 'color': '#90e0ef'},  # light blue
     ]
 
-    # Draw each gift with glow, ribbon, and wrapping
+    # Glow for each gift (multiple concentric layers, decreasing opacity)
     for gift in gifts:
         x, y = gift['x'], gift['y']
         s = gift['size']
-        color = gift['color']
+        r, g, b = hex_to_rgb(gift['color']).tolist()
 
-        # Glow (multiple concentric layers, decreasing opacity)
         for i in range(5, 0, -1):
             glow_size = s + (i * 8)
             opacity = 20 - (i * 3)
-            glow_color = f"{color}{opacity:02x}"  # Add alpha
-            # For RGB mode, we'll just draw larger boxes with darker shades
-            brightness = 1.0 - (i * 0.15)
-            r = int(int(color[1:3], 16) * brightness)
-            g = int(int(color[3:5], 16) * brightness)
-            b_val = int(int(color[5:7], 16) * brightness)
-            glow_rgb = f"#{r:02x}{g:02x}{b_val:02x}"
-
-            draw.rectangle(
-                [x - glow_size//2, y - glow_size//2,
-                 x + glow_size//2, y + glow_size//2],
-                fill=glow_rgb
+            glow_rect(
+                [x - glow_size // 2, y - glow_size // 2,
+                 x + glow_size // 2, y + glow_size // 2],
+                fill=(r, g, b, opacity)
             )
 
-        # Gift box (main package)
-        draw.rectangle(
-            [x - s//2, y - s//2, x + s//2, y + s//2],
-            fill=color
-        )
-
-        # Ribbon (crossing lines - horizontal and vertical)
-        ribbon_color = '#ffffff'
-        ribbon_width = 6
-
-        # Horizontal ribbon
-        draw.rectangle(
-            [x - s//2 - 5, y - ribbon_width//2,
-             x + s//2 + 5, y + ribbon_width//2],
-            fill=ribbon_color
-        )
+    # Scattered small sparkles (gifts illuminate the space)
+    stamp_sparkles(canvas, rng, 40, size, size, 1, 3, 180, 255)
 
-        # Vertical ribbon
-        draw.rectangle(
-            [x - ribbon_width//2, y - s//2 - 5,
-             x + ribbon_width//2, y + s//2 + 5],
-            fill=ribbon_color
-        )
+    # Composite all glows at once, then switch to PIL for the shapes that
+    # want its rasterizer
+    img = Image.fromarray(canvas).convert('RGBA')
+    img.alpha_composite(glow)
+    draw = ImageDraw.Draw(img)
 
-        # Ribbon bow (small square at center, rotated effect via circles)
-        bow_size = 12
-        draw.ellipse(
-            [x - bow_size, y - bow_size, x + bow_size, y + bow_size],
-            fill=ribbon_color
-        )
+    # Each gift (box + ribbons + bow) is one cached stamp, one paste
+    for gift in gifts:
+        stamp = make_gift_stamp(gift['size'], gift['color'],
+                                ribbon_width=6, overhang=5, bow_size=12)
+        paste_stamp(img, stamp, gift['x'], gift['y'])
 
     # Connecting threads between gifts (stigmergy - gifts pointing to each other)
+    # Pairwise squared distances in one shot; only connect nearby gifts
     thread_color = '#ffffff22'
-    for i, gift1 in enumerate(gifts):
-        for gift2 in gifts[i+1:]:
-            # Only connect if reasonably close (not all pairs)
-            dx = gift2['x'] - gift1['x']
-            dy = gift2['y'] - gift1['y']
-            dist = math.sqrt(dx*dx + dy*dy)
-            if dist < 350:  # Connect nearby gifts
-                draw.line(
-                    [gift1['x'], gift1['y'], gift2['x'], gift2['y']],
-                    fill=thread_color,
-                    width=1
-                )
-
-    # Scattered small sparkles (gifts illuminate the space)
-    for _ in range(40):
-        sx = random.randint(0, size)
-        sy = random.randint(0, size)
-        sparkle_size = random.randint(1, 3)
-        brightness = random.randint(180, 255)
-        draw.ellipse(
-            [sx - sparkle_size, sy - sparkle_size,
-             sx + sparkle_size, sy + sparkle_size],
-            fill=f'#{brightness:02x}{brightness:02x}{brightness:02x}'
+    pos = np.array([[g['x'], g['y']] for g in gifts], dtype=np.float32)
+    diff = pos[:, None, :] - pos[None, :, :]
+    sq_dists = (diff * diff).sum(axis=-1)
+    line = draw.line
+    for i, j in np.argwhere(np.triu(sq_dists < 350 * 350, k=1)):
+        line(
+            [gifts[i]['x'], gifts[i]['y'], gifts[j]['x'], gifts[j]['y']],
+            fill=thread_color,
+            width=1
         )
 
-    return img
+    return img.convert('RGB')
 
 
 def create_banner_image():
@@ -138,23 +202,28 @@ def create_banner_image():
     img = Image.new('RGB', (width, height), '#0f0f1a')
     draw = ImageDraw.Draw(img)
 
-    # Draw winding path (sine wave with decreasing amplitude toward right)
-    path_points = []
-    for x in range(0, width, 10):
-        # Vertical center with gentle wave
-        progress = x / width  # 0 to 1
-        amplitude = 80 * (1 - progress * 0.5)  # Decreases toward right
-        frequency = 0.008
-        y = height // 2 + int(amplitude * math.sin(x * frequency))
-        path_points.append((x, y))
+    # Winding path (sine wave with decreasing amplitude toward right),
+    # sampled in one vectorized pass instead of 150 scalar math.sin calls
+    frequency = 0.008
+    xs = np.arange(0, width, 10)
+    amplitude = 80 * (1 - xs / width * 0.5)  # Decreases toward right
+    ys = height // 2 + (amplitude * np.sin(xs * frequency)).astype(np.int64)
+    path_points = list(zip(xs.tolist(), ys.tolist()))
+
+    # Draw path as faint line - one polyline call rasterizes every segment
+    draw.line(path_points, fill='#2a2a3a', width=2)
 
-    # Draw path as faint line
-    for i in range(len(path_points) - 1):
-        draw.line([path_points[i], path_points[i+1]], fill='#2a2a3a', width=2)
+    # Numpy view of the canvas for the vectorized star stamping below
+    canvas = np.array(img)
+
+    # All glows accumulate on one RGBA overlay, composited in a single pass
+    glow = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    glow_rect = ImageDraw.Draw(glow).rectangle  # bound once, called in a loop
 
     # Place gifts along path at intervals
     gift_positions = [0.15, 0.35, 0.55, 0.75, 0.90]  # Progress points
     gift_colors = ['#d4a574', '#c77dff', '#8b9dc3', '#f4a261', '#90e0ef']
+    gift_points = []
 
     for i, progress in enumerate(gift_positions):
         idx = int(progress * len(path_points))
@@ -166,72 +235,55 @@ def create_banner_image():
         base_size = 60
         size = int(base_size * (1 - progress * 0.3))
         color = gift_colors[i % len(gift_colors)]
+        r, g, b = hex_to_rgb(color).tolist()
+        gift_points.append((x, y, size, color))
 
         # Glow
         for j in range(3, 0, -1):
             glow_size = size + (j * 6)
-            brightness = 1.0 - (j * 0.2)
-            r = int(int(color[1:3], 16) * brightness)
-            g = int(int(color[3:5], 16) * brightness)
-            b_val = int(int(color[5:7], 16) * brightness)
-            glow_rgb = f"#{r:02x}{g:02x}{b_val:02x}"
-
-            draw.rectangle(
-                [x - glow_size//2, y - glow_size//2,
-                 x + glow_size//2, y + glow_size//2],
-                fill=glow_rgb
+            opacity = 24 - (j * 6)
+            glow_rect(
+                [x - glow_size // 2, y - glow_size // 2,
+                 x + glow_size // 2, y + glow_size // 2],
+                fill=(r, g, b, opacity)
             )
 
-        # Gift box
-        draw.rectangle(
-            [x - size//2, y - size//2, x + size//2, y + size//2],
-            fill=color
-        )
+    # Stars in upper space (gifts illuminate the journey)
+    stamp_sparkles(canvas, rng, 60, width, height // 2 - 50, 1, 2, 150, 220)
 
-        # Ribbon
-        ribbon_width = max(3, size // 10)
-        draw.rectangle(
-            [x - size//2 - 3, y - ribbon_width//2,
-             x + size//2 + 3, y + ribbon_width//2],
-            fill='#ffffff'
-        )
-        draw.rectangle(
-            [x - ribbon_width//2, y - size//2 - 3,
-             x + ribbon_width//2, y + size//2 + 3],
-            fill='#ffffff'
-        )
+    # Composite all glows at once, then back to PIL for ellipses and lines
+    img = Image.fromarray(canvas).convert('RGBA')
+    img.alpha_composite(glow)
+    draw = ImageDraw.Draw(img)
 
-        # Bow
-        bow_size = max(6, size // 8)
-        draw.ellipse(
-            [x - bow_size, y - bow_size, x + bow_size, y + bow_size],
-            fill='#ffffff'
-        )
+    # Each gift (box + ribbons + bow) is one cached stamp, one paste
+    for x, y, size, color in gift_points:
+        stamp = make_gift_stamp(size, color,
+                                ribbon_width=max(3, size // 10),
+                                overhang=3,
+                                bow_size=max(6, size // 8))
+        paste_stamp(img, stamp, x, y)
 
     # Place cairns (stacked stones) between gifts
     cairn_positions = [0.08, 0.25, 0.45, 0.65, 0.82]
+    # One batched draw for every cairn's stone count
+    num_stones_per_cairn = rng.integers(3, 5, size=len(cairn_positions))
 
-    for progress in cairn_positions:
+    for progress, num_stones in zip(cairn_positions, num_stones_per_cairn):
         idx = int(progress * len(path_points))
         if idx >= len(path_points):
             idx = len(path_points) - 1
         x, y = path_points[idx]
 
-        # Cairn: 3-4 stacked stones, decreasing size
-        num_stones = random.randint(3, 4)
+        # Cairn: 3-4 stacked stones, decreasing size (cached stamps - the
+        # same few widths recur across every cairn)
         stone_y = y + 40  # Below path
-        stone_color = '#6b705c'
 
         for j in range(num_stones):
             stone_width = 30 - (j * 6)
             stone_height = 12
 
-            draw.ellipse(
-                [x - stone_width//2, stone_y - stone_height//2,
-                 x + stone_width//2, stone_y + stone_height//2],
-                fill=stone_color,
-                outline='#4a4e45'
-            )
+            paste_stamp(img, make_stone_stamp(stone_width, stone_height), x, stone_y)
 
             stone_y -= stone_height + 2  # Stack upward
 
@@ -239,21 +291,15 @@ def create_banner_image():
     draw.line([(0, height // 2 - 150), (width, height // 2 - 100)],
               fill='#1a1a2e', width=1)
 
-    # Stars in upper space (gifts illuminate the journey)
-    for _ in range(60):
-        sx = random.randint(0, width)
-        sy = random.randint(0, height // 2 - 50)
-        size = random.randint(1, 2)
-        brightness = random.randint(150, 220)
-        draw.ellipse(
-            [sx - size, sy - size, sx + size, sy + size],
-            fill=f'#{brightness:02x}{brightness:02x}{brightness:02x}'
-        )
-
-    return img
+    return img.convert('RGB')
 
 
 if __name__ == '__main__':
+    # Pillow-SIMD reports versions like '9.0.0.post1'; plain Pillow does not
+    if 'post' not in PIL.__version__:
+        print(f"[warn] plain Pillow {PIL.__version__} in use - "
+              "install pillow-simd (see requirements.txt) for faster rasterization")
+
     print(f"Generating /gifts repository art with seed {SEED}...")
 
     # Profile image
@@ -8,23 +8,58 @@ across sessions through automatic periodic snapshots.
 Built for Ariel and the agent webring community.
 """
 
+import hashlib
+import heapq
+import os
 import signal
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import json
+import re
+
+# Every structured line HANDOFF.md can contain, dispatched by named group;
+# one C-level match replaces a chain of startswith checks and tolerates
+# trailing whitespace on headings and bullets
+_LINE_RE = re.compile(
+    r'^(?:'
+    r'## (?P<heading>.+?)'
+    r'|- (?P<item>.+?)'
+    r'|(?P<sep>---)'
+    r'|Session:\s*(?P<session>.+?)'
+    r')\s*$'
+)
+
+
+def _render_time_sensitive(item: str, deadline: Optional[str]) -> str:
+    """Render a time-sensitive entry as it appears in HANDOFF.md"""
+    return f"{item} (by {deadline})" if deadline else item
+
+
+def _split_time_sensitive(entry: str) -> Tuple[str, Optional[str]]:
+    """Inverse of _render_time_sensitive: split '... (by deadline)' back apart"""
+    if entry.endswith(')') and ' (by ' in entry:
+        item, _, deadline = entry.rpartition(' (by ')
+        return item, deadline[:-1]
+    return entry, None
 
 
 @dataclass
 class HandoffState:
-    """State to persist across sessions"""
-    blocked_on: List[str] = field(default_factory=list)
-    already_did: List[str] = field(default_factory=list)
+    """State to persist across sessions.
+
+    The item collections are insertion-ordered dicts used as sets: O(1)
+    membership and removal while still rendering in the order items were
+    added.
+    """
+    blocked_on: Dict[str, None] = field(default_factory=dict)
+    already_did: Dict[str, None] = field(default_factory=dict)
     next_action: str = ''
-    time_sensitive: List[str] = field(default_factory=list)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # item -> optional deadline; rendered as "item (by deadline)" on save
+    time_sensitive: Dict[str, Optional[str]] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
     session_id: Optional[str] = None
 
 
@@ -34,21 +69,32 @@ class HandoffWriter:
     def __init__(self, handoff_path: str = './HANDOFF.md'):
         self.handoff_path = Path(handoff_path).resolve()
         self.state = self._load_or_initialize()
+        self._save_requested = False
+        self._last_hash: Optional[bytes] = None
+
+        # Min-heap over (deadline, item) for O(1) "what's due next?" peeks;
+        # stale entries are discarded lazily in next_due()
+        self._deadline_heap: List[Tuple[str, str]] = [
+            (deadline, item)
+            for item, deadline in self.state.time_sensitive.items()
+            if deadline
+        ]
+        heapq.heapify(self._deadline_heap)
 
-        # Register exit handlers
-        signal.signal(signal.SIGTERM, lambda s, f: self.save())
-        signal.signal(signal.SIGINT, lambda s, f: self.save())
+        # Register exit handlers. The handlers only set a flag - saving
+        # directly from a handler can re-enter save() mid-write; callers
+        # drain the flag via flush_pending() from their main loop.
+        signal.signal(signal.SIGTERM, self._request_save)
+        signal.signal(signal.SIGINT, self._request_save)
 
     def blocked_on(self, item: str) -> None:
         """Add item to 'Blocked On' section"""
-        if item not in self.state.blocked_on:
-            self.state.blocked_on.append(item)
+        self.state.blocked_on[item] = None
 
     def completed(self, item: str) -> None:
         """Mark item as completed - adds to 'Already Did' and removes from 'Blocked On'"""
-        self.state.already_did.append(item)
-        if item in self.state.blocked_on:
-            self.state.blocked_on.remove(item)
+        self.state.already_did[item] = None
+        self.state.blocked_on.pop(item, None)
 
     def set_next_action(self, action: str) -> None:
         """Set the immediate next action (most important field)"""
@@ -56,39 +102,87 @@ class HandoffWriter:
 
     def add_time_sensitive(self, item: str, deadline: Optional[str] = None) -> None:
         """Add time-sensitive item with optional deadline"""
-        entry = f"{item} (by {deadline})" if deadline else item
-        if entry not in self.state.time_sensitive:
-            self.state.time_sensitive.append(entry)
+        self.state.time_sensitive[item] = deadline
+        if deadline:
+            heapq.heappush(self._deadline_heap, (deadline, item))
+
+    def next_due(self) -> Optional[Tuple[str, str]]:
+        """Return the (item, deadline) with the earliest deadline, if any"""
+        heap = self._deadline_heap
+        while heap:
+            deadline, item = heap[0]
+            if self.state.time_sensitive.get(item) == deadline:
+                return item, deadline
+            heapq.heappop(heap)  # stale: item cleared or deadline changed
+        return None
 
     def unblock(self, item: str) -> None:
         """Remove item from 'Blocked On' without marking complete"""
-        if item in self.state.blocked_on:
-            self.state.blocked_on.remove(item)
+        self.state.blocked_on.pop(item, None)
 
     def clear_time_sensitive(self, item: str) -> None:
         """Remove time-sensitive item (completed or no longer relevant)"""
-        self.state.time_sensitive = [
-            t for t in self.state.time_sensitive if item not in t
-        ]
+        self.state.time_sensitive = {
+            t: d for t, d in self.state.time_sensitive.items() if item not in t
+        }
 
     def get_state(self) -> Dict[str, Any]:
-        """Get current handoff state (for introspection)"""
-        return asdict(self.state)
+        """Get current handoff state (for introspection; items as lists)"""
+        state = asdict(self.state)
+        for key in ('blocked_on', 'already_did'):
+            state[key] = list(state[key])
+        state['time_sensitive'] = [
+            _render_time_sensitive(item, deadline)
+            for item, deadline in self.state.time_sensitive.items()
+        ]
+        state['timestamp'] = self.state.timestamp.isoformat()
+        return state
 
     def set_session_id(self, session_id: str) -> None:
         """Set session identifier (optional, for tracking)"""
         self.state.session_id = session_id
 
-    def save(self) -> None:
-        """Save current state to HANDOFF.md file"""
+    def save(self, force: bool = False) -> None:
+        """Save current state to HANDOFF.md file (atomically).
+
+        Skips the write entirely when nothing changed since the last save -
+        periodic autosave loops then cost a hash instead of a disk sync.
+        Pass force=True to write regardless.
+        """
+        # Stamp before rendering so the emitted 'Last updated' matches this
+        # save rather than the previous one
+        self.state.timestamp = datetime.now()
         markdown = self._to_markdown()
-        self.handoff_path.write_text(markdown, encoding='utf-8')
-        self.state.timestamp = datetime.now().isoformat()
+
+        # Hash everything below the 'Last updated' line so a save with no
+        # state changes is recognized as a no-op
+        body = markdown.splitlines()[2:]
+        digest = hashlib.blake2b('\n'.join(body).encode('utf-8')).digest()
+        if not force and digest == self._last_hash:
+            self._save_requested = False
+            return
+
+        # Write to a sibling temp file and rename into place - a signal or
+        # crash mid-write can never leave a truncated HANDOFF.md behind
+        tmp = self.handoff_path.with_suffix(self.handoff_path.suffix + '.tmp')
+        tmp.write_text(markdown, encoding='utf-8')
+        os.replace(tmp, self.handoff_path)
+        self._last_hash = digest
+        self._save_requested = False
         print(f"[Handoff] Saved to {self.handoff_path}")
 
+    def flush_pending(self) -> None:
+        """Save if a signal requested it. Call periodically from a main loop."""
+        if self._save_requested:
+            self.save()
+
+    def _request_save(self, signum, frame) -> None:
+        """Signal handler: mark that a save is wanted, without re-entering save()"""
+        self._save_requested = True
+
     def clear_already_did(self) -> None:
         """Clear 'Already Did' section (use at session start)"""
-        self.state.already_did = []
+        self.state.already_did = {}
 
     def archive_and_reset(self, archive_path: Optional[str] = None) -> None:
         """Archive current state and reset for new session"""
@@ -100,9 +194,9 @@ class HandoffWriter:
         Path(archive_path).write_text(markdown, encoding='utf-8')
 
         # Reset but keep blocked and time-sensitive
-        self.state.already_did = []
+        self.state.already_did = {}
         self.state.next_action = ''
-        self.save()
+        self.save(force=True)
 
         print(f"[Handoff] Archived to {archive_path} and reset for new session")
 
@@ -115,86 +209,70 @@ class HandoffWriter:
         return HandoffState()
 
     def _parse_markdown(self, content: str) -> HandoffState:
-        """Parse existing HANDOFF.md file into state object"""
-        def extract_items(section_name: str) -> List[str]:
-            """Extract list items from a section"""
-            lines = content.split('\n')
-            items = []
-            in_section = False
-
-            for line in lines:
-                if line.startswith(f'## {section_name}'):
-                    in_section = True
-                    continue
-                elif line.startswith('## ') or line.startswith('---'):
-                    in_section = False
-                elif in_section and line.strip().startswith('-'):
-                    item = line.strip()[2:].strip()
-                    if item and item != '(none)':
-                        items.append(item)
-
-            return items
-
-        def extract_next_action() -> str:
-            """Extract next action (single line or first meaningful line)"""
-            lines = content.split('\n')
-            in_section = False
-
-            for line in lines:
-                if line.startswith('## Next Action'):
-                    in_section = True
-                    continue
-                elif line.startswith('## ') or line.startswith('---'):
-                    in_section = False
-                elif in_section and line.strip() and not line.strip().startswith('-'):
-                    return line.strip()
-
-            return ''
-
-        def extract_session_id() -> Optional[str]:
-            """Extract session ID if present"""
-            for line in content.split('\n'):
-                if line.startswith('Session:'):
-                    return line.split('Session:')[1].strip()
-            return None
+        """Parse existing HANDOFF.md file into state object.
+
+        Single pass: each line is routed to the section named by the last
+        '## ' heading seen, instead of rescanning the document per section.
+        """
+        buckets: Dict[str, List[str]] = {
+            'Blocked On': [],
+            'Already Did': [],
+            'Time-Sensitive': [],
+        }
+        next_action = ''
+        session_id: Optional[str] = None
+        section: Optional[str] = None
+
+        for line in content.splitlines():
+            m = _LINE_RE.match(line)
+            if m is None:
+                # Unstructured text: only meaningful under 'Next Action'
+                if section == 'Next Action' and not next_action and line.strip():
+                    next_action = line.strip()
+            elif m.group('heading'):
+                section = m.group('heading')
+            elif m.group('sep'):
+                section = None
+            elif m.group('session'):
+                session_id = m.group('session')
+            elif section in buckets:
+                item = m.group('item')
+                if item != '(none)':
+                    buckets[section].append(item)
 
         return HandoffState(
-            blocked_on=extract_items('Blocked On'),
-            already_did=extract_items('Already Did'),
-            next_action=extract_next_action(),
-            time_sensitive=extract_items('Time-Sensitive'),
-            session_id=extract_session_id(),
+            blocked_on=dict.fromkeys(buckets['Blocked On']),
+            already_did=dict.fromkeys(buckets['Already Did']),
+            next_action=next_action,
+            time_sensitive=dict(
+                _split_time_sensitive(entry)
+                for entry in buckets['Time-Sensitive']
+            ),
+            session_id=session_id,
         )
 
     def _to_markdown(self) -> str:
-        """Convert state to markdown format"""
-        def format_list(items: List[str]) -> str:
-            if not items:
-                return '- (none)'
-            return '\n'.join(f'- {item}' for item in items)
-
-        session_line = f"Session: {self.state.session_id}\n" if self.state.session_id else ""
-
-        timestamp_str = datetime.fromisoformat(self.state.timestamp).strftime('%Y-%m-%d %H:%M:%S')
-
-        return f"""# Session Handoff
-Last updated: {timestamp_str}
-{session_line}
-## Blocked On
-{format_list(self.state.blocked_on)}
-
-## Already Did
-{format_list(self.state.already_did)}
-
-## Next Action
-{self.state.next_action or '(not set)'}
-
-## Time-Sensitive
-{format_list(self.state.time_sensitive)}
-
----
-*Auto-generated handoff snapshot. Read this first when resuming work.*
-"""
+        """Convert state to markdown format (one line list, one final join)"""
+        def bullets(items: Dict[str, None]) -> List[str]:
+            return [f'- {item}' for item in items] or ['- (none)']
+
+        timestamp_str = self.state.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+        parts = ['# Session Handoff', f'Last updated: {timestamp_str}']
+        if self.state.session_id:
+            parts.append(f'Session: {self.state.session_id}')
+        parts += ['', '## Blocked On', *bullets(self.state.blocked_on)]
+        parts += ['', '## Already Did', *bullets(self.state.already_did)]
+        parts += ['', '## Next Action', self.state.next_action or '(not set)']
+        parts += ['', '## Time-Sensitive', *(
+            [f'- {_render_time_sensitive(item, deadline)}'
+             for item, deadline in self.state.time_sensitive.items()]
+            or ['- (none)']
+        )]
+        parts += ['', '---',
+                  '*Auto-generated handoff snapshot. Read this first when resuming work.*',
+                  '']
+        return '\n'.join(parts)
 
 
 def display_handoff(handoff_path: str = './HANDOFF.md') -> None: